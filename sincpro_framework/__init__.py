@@ -1,3 +1,4 @@
+from .context.execution_context import get_current_context
 from .middleware import Middleware
 from .sincpro_abstractions import (
     ApplicationService,
@@ -14,6 +15,7 @@ __all__ = [
     "DataTransferObject",
     "Feature",
     "UseFramework",
+    "get_current_context",
     "logger",
     "Middleware",
     "TypeDTO",
@@ -1,5 +1,5 @@
 from logging import Logger
-from typing import Callable, Dict, Optional, Type
+from typing import Callable, Dict, List, Optional, Type
 
 from .exceptions import DTOAlreadyRegistered, UnknownDTOToExecute
 from .sincpro_abstractions import (
@@ -12,6 +12,9 @@ from .sincpro_abstractions import (
 )
 from .sincpro_logger import is_logger_in_debug, logger
 
+# The framework log level is read once from the settings, it does not change at runtime
+_DEBUG_LOGGING = is_logger_in_debug()
+
 
 class FeatureBus(Bus):
     """First layer of the framework, atomic features"""
@@ -19,6 +22,7 @@ class FeatureBus(Bus):
     def __init__(self, logger_bus: Logger = logger):  # type: ignore[assignment]
         self.feature_registry: Dict[str, Feature] = dict()
         self.handle_error: Optional[Callable] = None
+        self._on_register: List[Callable[[], None]] = []
         self.logger: Logger = logger_bus or logger  # type: ignore[assignment]
 
     def register_feature(self, dto: Type[DataTransferObject], feature: Feature) -> bool:
@@ -30,6 +34,8 @@ class FeatureBus(Bus):
 
         self.logger.info(f"Registering feature [{dto.__name__}]")
         self.feature_registry[dto.__name__] = feature
+        for callback in self._on_register:
+            callback()
         return True
 
     def execute(  # type: ignore[override]
@@ -38,7 +44,7 @@ class FeatureBus(Bus):
         """Execute a feature, and handle error if exists error handler"""
         dto_name = dto.__class__.__name__
 
-        if is_logger_in_debug() or self.log_after_execution:
+        if _DEBUG_LOGGING or self.log_after_execution:
             self.logger.info(
                 f"Executing feature dto: [{dto_name}]",
             )
@@ -67,6 +73,7 @@ class ApplicationServiceBus(Bus):
     def __init__(self, logger_bus: Logger = logger):  # type: ignore[assignment]
         self.app_service_registry: Dict[str, ApplicationService] = dict()
         self.handle_error: Optional[Callable] = None
+        self._on_register: List[Callable[[], None]] = []
         self.logger = logger_bus or logger
 
     def register_app_service(
@@ -82,6 +89,8 @@ class ApplicationServiceBus(Bus):
 
         self.logger.info(f"Registering application service [{dto.__name__}]")
         self.app_service_registry[dto.__name__] = app_service
+        for callback in self._on_register:
+            callback()
         return True
 
     def execute(  # type: ignore[override]
@@ -89,7 +98,7 @@ class ApplicationServiceBus(Bus):
     ) -> TypeDTOResponse | None:
         """Execute an application service, and handle error if exists error handler"""
         dto_name = dto.__class__.__name__
-        if is_logger_in_debug() or self.log_after_execution:
+        if _DEBUG_LOGGING or self.log_after_execution:
             self.logger.info(
                 f"Executing app service dto: [{dto_name}]",
             )
@@ -131,6 +140,11 @@ class FrameworkBus(Bus):
         self.app_service_bus = app_service_bus
         self.handle_error: Optional[Callable] = None
         self.logger = logger_bus or logger
+        self._routes: Dict[type, Bus] = dict()
+
+        # A registration on either bus can change or conflict with a cached route
+        self.feature_bus._on_register.append(self._routes.clear)
+        self.app_service_bus._on_register.append(self._routes.clear)
 
         registered_features = set(self.feature_bus.feature_registry.keys())
         registered_app_services = set(self.app_service_bus.app_service_registry.keys())
@@ -157,26 +171,12 @@ class FrameworkBus(Bus):
         """
         dto_name = dto.__class__.__name__
         try:
-            if (
-                dto_name in self.app_service_bus.app_service_registry
-                and dto_name in self.feature_bus.feature_registry
-            ):
-                raise DTOAlreadyRegistered(
-                    f"Data transfer object {dto_name} is present in application services and features, Change the "
-                    f"name of the feature or create another framework instance to handle in doupled wat"
-                )
-            if dto_name in self.feature_bus.feature_registry:
-                response = self.feature_bus.execute(dto)
-                return response
+            route = self._routes.get(dto.__class__)
+            if route is None:
+                route = self._resolve_route(dto_name)
+                self._routes[dto.__class__] = route
 
-            if dto_name in self.app_service_bus.app_service_registry:
-                response = self.app_service_bus.execute(dto)
-                return response
-
-            raise UnknownDTOToExecute(
-                f"the DTO {dto_name} was not able to execute nothing review if the decorators are used properly, "
-                f"otherwise the DTO {dto_name} was never register using the decorator"
-            )
+            return route.execute(dto)
 
         except Exception as error:
             if self.handle_error:
@@ -184,3 +184,24 @@ class FrameworkBus(Bus):
 
             self.logger.exception(f"Error with DTO {dto_name}({dto})")
             raise error
+
+    def _resolve_route(self, dto_name: str) -> Bus:
+        """Find the bus that executes the DTO, the result is cached by DTO type"""
+        if (
+            dto_name in self.app_service_bus.app_service_registry
+            and dto_name in self.feature_bus.feature_registry
+        ):
+            raise DTOAlreadyRegistered(
+                f"Data transfer object {dto_name} is present in application services and features, Change the "
+                f"name of the feature or create another framework instance to handle in doupled wat"
+            )
+        if dto_name in self.feature_bus.feature_registry:
+            return self.feature_bus
+
+        if dto_name in self.app_service_bus.app_service_registry:
+            return self.app_service_bus
+
+        raise UnknownDTOToExecute(
+            f"the DTO {dto_name} was not able to execute nothing review if the decorators are used properly, "
+            f"otherwise the DTO {dto_name} was never register using the decorator"
+        )
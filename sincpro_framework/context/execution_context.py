@@ -0,0 +1,22 @@
+"""
+Execution context shared by the Features and ApplicationServices of the running DTO
+
+The framework activates its context in a ContextVar for the duration of each execution,
+so handlers read it without any per-instance copy and every thread or asyncio task keeps
+its own value.
+"""
+
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Mapping
+
+EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+execution_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    "sincpro_framework_execution_context", default=EMPTY_CONTEXT
+)
+
+
+def get_current_context() -> Mapping[str, Any]:
+    """Get the read-only context of the DTO being executed, empty outside an execution"""
+    return execution_context.get()
@@ -5,7 +5,9 @@ Provides automatic metadata propagation and scope management
 with instance-based context storage for proper isolation.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .execution_context import EMPTY_CONTEXT
 
 if TYPE_CHECKING:
     from ..use_bus import UseFramework
@@ -17,12 +19,15 @@ class FrameworkContext:
     and scope management with instance-based storage.
     """
 
+    __slots__ = ("_is_entered", "framework", "context", "parent_context")
+
     def __init__(self, framework_instance: "UseFramework", context: Mapping[str, Any]):
         self._is_entered: bool = False
         self.framework = framework_instance
 
-        self.context: Dict[str, Any] = dict(context)
-        self.parent_context: Dict[str, Any] = framework_instance._get_context().copy()
+        self.context: Mapping[str, Any] = context
+        # Snapshot of the framework context taken on enter and restored on exit
+        self.parent_context: Mapping[str, Any] = EMPTY_CONTEXT
 
     def __enter__(self) -> "UseFramework":
         """Enter the context manager and return framework instance with context"""
@@ -30,17 +35,18 @@ class FrameworkContext:
             raise RuntimeError("Context manager is already entered")
 
         self._is_entered = True
+        # The parent context is read-only, so it is kept as is without copying it
+        self.parent_context = self.framework._get_context()
         # Merge contexts: parent context first, then new context overrides
-        merged_context = {**self.parent_context, **self.context}
-        self.framework._set_context(merged_context)
+        if self.context:
+            self.framework._set_context({**self.parent_context, **self.context})
+        else:
+            self.framework._set_context(self.parent_context)
         self.framework.logger.debug(f"with context: {self.context}")
-        self.framework._inject_context_to_services_and_features(merged_context)
 
         return self.framework
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the context manager and restore previous context"""
         self.framework._set_context(self.parent_context)
-        # Inject the restored context to services
-        self.framework._inject_context_to_services_and_features(self.parent_context)
         return False
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
 
 if TYPE_CHECKING:
     from ..use_bus import UseFramework
@@ -6,15 +6,15 @@ if TYPE_CHECKING:
 class FrameworkContext:
     """
     Framework context manager that provides automatic metadata propagation
-    and scope management with instance-based storage.
+    and scope management with a context variable per framework instance.
 
     When used with 'with' statement, returns the UseFramework instance
     with the context applied.
     """
 
     framework: "UseFramework"
-    context: Dict[str, Any]
-    parent_context: Dict[str, Any]
+    context: Mapping[str, Any]
+    parent_context: Mapping[str, Any]
 
     def __init__(
         self, framework_instance: "UseFramework", context: Mapping[str, Any]
@@ -1,37 +1,34 @@
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from sincpro_framework.bus import FrameworkBus
 
+from .execution_context import EMPTY_CONTEXT
+
 
 class ContextMixin:
     """
-    Mixin to provide context access to Features and ApplicationServices
+    Mixin to store the context of a framework instance, the context is activated for
+    Features and ApplicationServices while the framework executes a DTO
     """
 
+    __slots__ = ()
+
     bus: FrameworkBus
-    _context: Dict[str, Any]
+    _context: Mapping[str, Any]
 
-    def _set_context(self, context: Dict[str, Any]) -> None:
-        """Set the context for the current framework instance"""
-        self._context = context
+    def _set_context(self, context: Mapping[str, Any]) -> None:
+        """Set the context for the current framework instance, a context that is already
+        read-only (e.g. a restored parent context) is stored without wrapping it again"""
+        if type(context) is MappingProxyType:
+            self._context = context
+        else:
+            self._context = MappingProxyType(context) if context else EMPTY_CONTEXT
 
-    def _get_context(self):
+    def _get_context(self) -> Mapping[str, Any]:
         """Get the current context for the framework instance"""
-        return self._context if hasattr(self, "_context") else dict()
+        return self._context
 
     def _clean_context(self) -> None:
         """Clean the context for the current framework instance"""
-        self._context = dict()
-
-    def _inject_context_to_services_and_features(self, context: Dict[str, Any]) -> None:
-        """Update context in all registered services with current context"""
-
-        # Only inject if bus is built and available
-        if self.bus is None:
-            return
-
-        for feature in self.bus.feature_bus.feature_registry.values():
-            feature.context = context.copy()
-
-        for app_service in self.bus.app_service_bus.app_service_registry.values():
-            app_service.context = context.copy()
+        self._context = EMPTY_CONTEXT
@@ -12,3 +12,7 @@ class UnknownDTOToExecute(Exception):
 
 class SincproFrameworkNotBuilt(Exception):
     pass
+
+
+class SincproFrameworkAlreadyBuilt(Exception):
+    pass
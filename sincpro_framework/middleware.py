@@ -38,6 +38,10 @@ class MiddlewarePipeline:
         Preserves registry compatibility by monkey patching transformed DTOs
         to maintain the original DTO class for registry lookup.
         """
+        # Nothing to process (the common case), the DTO goes straight to the executor
+        if not self.middlewares:
+            return executor(dto, **kwargs)
+
         # Store original class for registry compatibility
         original_dto_class = dto.__class__
 
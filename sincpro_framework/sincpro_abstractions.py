@@ -4,6 +4,8 @@ from typing import Generic, Type, cast
 from pydantic import BaseModel, ConfigDict
 from typing_extensions import TypeVar
 
+from .context.execution_context import execution_context
+
 TypeDTO = TypeVar("TypeDTO", bound="DataTransferObject")
 TypeDTOResponse = TypeVar("TypeDTOResponse", bound="DataTransferObject")
 ContextT = TypeVar("ContextT")
@@ -12,13 +14,28 @@ ContextT = TypeVar("ContextT")
 TFeature = TypeVar("TFeature", bound="Feature")
 TApplicationService = TypeVar("TApplicationService", bound="ApplicationService")
 
+# Shared by every DTO so subclasses inherit one config object instead of redefining it
+_DTO_CONFIG = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
 
 class DataTransferObject(BaseModel):
     """
     Abstraction that represent a object that will travel through to any layer
+
+    The pydantic schema is built lazily (``defer_build``) on first validation, so DTOs that
+    are defined but never used do not pay the schema build cost at import time.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = _DTO_CONFIG
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """Build the deferred pydantic schema now instead of on first validation.
+
+        The framework calls it for every registered DTO when the bus is built, so the first
+        request does not pay the schema build cost.
+        """
+        cls.model_rebuild()
 
 
 class Bus(ABC):
@@ -71,13 +88,17 @@ class Feature(ABC, Generic[TypeDTO, TypeDTOResponse, ContextT]):
                 return MyResponseDTO(result="example")
     """
 
-    context: ContextT
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         """
         Initialize the Feature. Dependencies are injected automatically by the framework.
         """
-        self.context = cast(ContextT, {})
+
+    @property
+    def context(self) -> ContextT:
+        """Read-only context of the DTO being executed, activated by the framework"""
+        return cast(ContextT, execution_context.get())
 
     @abstractmethod
     def execute(self, dto: TypeDTO) -> TypeDTOResponse | None:
@@ -136,7 +157,8 @@ class ApplicationService(ABC, Generic[TypeDTO, TypeDTOResponse, ContextT]):
                 return MyResponseDTO(result="example")
     """
 
-    context: ContextT
+    __slots__ = ("feature_bus",)
+
     feature_bus: Bus
 
     def __init__(self, feature_bus: Bus, *args, **kwargs):
@@ -145,7 +167,11 @@ class ApplicationService(ABC, Generic[TypeDTO, TypeDTOResponse, ContextT]):
         Additional dependencies are injected automatically by the framework.
         """
         self.feature_bus = feature_bus
-        self.context = cast(ContextT, {})
+
+    @property
+    def context(self) -> ContextT:
+        """Read-only context of the DTO being executed, activated by the framework"""
+        return cast(ContextT, execution_context.get())
 
     @abstractmethod
     def execute(self, dto: TypeDTO) -> TypeDTOResponse | None:
@@ -5,7 +5,11 @@ from typing import Any, Generic, Type, overload
 from pydantic import BaseModel
 from typing_extensions import TypeVar
 
-class DataTransferObject(BaseModel): ...
+class DataTransferObject(BaseModel):
+    @classmethod
+    def rebuild(cls) -> None:
+        """Build the deferred pydantic schema now instead of on first validation."""
+        ...
 
 TypeDTO = TypeVar("TypeDTO", bound="DataTransferObject")
 TypeDTOResponse = TypeVar("TypeDTOResponse", bound="DataTransferObject")
@@ -43,6 +47,7 @@ class Feature(ABC, Generic[TypeDTO, TypeDTOResponse, ContextT], metaclass=abc.AB
             def execute(self, dto: MyInputDTO) -> MyResponseDTO: ...
     """
 
+    # Read-only property at runtime, declared as an attribute so handlers can narrow its type
     context: ContextT
 
     def __init__(self, *args, **kwargs) -> None: ...
@@ -72,6 +77,7 @@ class ApplicationService(
             def execute(self, dto: MyInputDTO) -> MyResponseDTO: ...
     """
 
+    # Read-only property at runtime, declared as an attribute so handlers can narrow its type
     context: ContextT
     feature_bus: Bus
     def __init__(self, feature_bus: Bus, *args, **kwargs) -> None: ...
@@ -1,11 +1,25 @@
 """Module to handle configuration based on yaml or init"""
 
+import copy
+import functools
 import os
 import warnings
-from typing import Literal, Type, TypeVar
+from typing import Any, Literal, Type, TypeVar
 
 import yaml
 from pydantic import BaseModel, ConfigDict, model_validator
+from sincpro_log import create_logger
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+_logger = create_logger("sincpro_framework")
+
+_ENV_PREFIX = "$ENV:"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+
 
 DEFAULT_CONFIG_FILE_PATH = (
     os.getenv("SINCPRO_FRAMEWORK_CONFIG_FILE", default=None)
@@ -13,44 +27,62 @@ DEFAULT_CONFIG_FILE_PATH = (
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(file_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a yaml file once per version of the file, libyaml reads the bytes directly"""
+    with open(file_path, "rb") as file:
+        return yaml.load(file, Loader=YamlLoader)
+
+
 def load_yaml_file(file_path: str) -> dict:
-    """Load a yaml file and return the content as a dictionary"""
-    with open(file_path) as file:
-        return yaml.safe_load(file)
+    """Load a yaml file and return the content as a dictionary
+
+    The parsed file is cached per path, modification time and size, so an edited file is
+    read again. Each caller gets its own copy so the env variable resolution never mutates
+    the cached content. Use ``clear_config_cache()`` to force a re-read.
+    """
+    file_stat = os.stat(file_path)
+    return copy.deepcopy(
+        _parse_yaml_file(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    )
 
 
 class SincproConfig(BaseModel):
     """Base config model"""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, use_enum_values=True, frozen=True)
 
     @model_validator(mode="before")
     def resolve_env_variables(cls, values):
         """Load all environment variables that start with $ENV:
         If the environment variable is not set, a warning is emitted and the default value is used
         """
+        environ = os.environ
+        fields = cls.model_fields
         for field_name, value in values.items():
-            if isinstance(value, str) and value.startswith("$ENV:"):
-                env_var_name = value.split("$ENV:")[1]
-                env_value = os.getenv(env_var_name)
-
-                if env_value is not None:
-                    values[field_name] = env_value
+            if type(value) is not str or not value.startswith(_ENV_PREFIX):
+                continue
+
+            env_var_name = value[_ENV_PREFIX_LEN:]
+            env_value = environ.get(env_var_name)
+
+            if env_value is not None:
+                values[field_name] = env_value
+            else:
+                # Get default value if available in model field definition
+                field_info = fields.get(field_name, None)
+                if field_info and field_info.default is not None:
+                    default_value = field_info.default
+                    warnings.warn(
+                        f"Environment variable [{env_var_name}] is not set for field [{field_name}]. "
+                        f"Using default value: {default_value}"
+                    )
+                    values[field_name] = default_value
                 else:
-                    # Get default value if available in model field definition
-                    field_info = cls.model_fields.get(field_name, None)
-                    if field_info and field_info.default is not None:
-                        default_value = field_info.default
-                        warnings.warn(
-                            f"Environment variable [{env_var_name}] is not set for field [{field_name}]. "
-                            f"Using default value: {default_value}"
-                        )
-                        values[field_name] = default_value
-                    else:
-                        warnings.warn(
-                            f"Environment variable [{env_var_name}] is not set for field [{field_name}] "
-                            f"and no default value was provided. This might cause issues."
-                        )
+                    warnings.warn(
+                        f"Environment variable [{env_var_name}] is not set for field [{field_name}] "
+                        f"and no default value was provided. This might cause issues."
+                    )
         return values
 
 
@@ -63,15 +95,34 @@ class DefaultFrameworkConfig(SincproConfig):
     sincpro_framework_log_level: Literal["INFO", "DEBUG"] = "DEBUG"
 
 
-def build_config_obj(
+def _env_references(value: Any) -> set[str]:
+    """Names of the environment variables referenced with $ENV: in a parsed yaml file"""
+    if type(value) is str:
+        return {value[_ENV_PREFIX_LEN:]} if value.startswith(_ENV_PREFIX) else set()
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return set()
+    return set().union(*map(_env_references, value))
+
+
+@functools.lru_cache(maxsize=32)
+def _file_env_references(file_path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Environment variables referenced by a version of a yaml file, sorted by name"""
+    return tuple(sorted(_env_references(_parse_yaml_file(file_path, mtime_ns, size))))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_config_obj(
     class_config_obj: Type[TypeSincproConfigModel],
     config_path: str,
-    sub_key: str | None = None,
+    sub_key: str | None,
+    mtime_ns: int,
+    size: int,
+    env_snapshot: tuple[tuple[str, str | None], ...],
 ) -> TypeSincproConfigModel:
-    """Build a config object from a dictionary
-    if sub_key is provided, it will return the sub_key of the config
-    """
-    config_dict = load_yaml_file(config_path)
+    """Build the config object, cached by file version and env variables snapshot"""
+    config_dict = copy.deepcopy(_parse_yaml_file(config_path, mtime_ns, size))
 
     if sub_key:
         config_section = config_dict.get(sub_key, None)
@@ -79,8 +130,40 @@ def build_config_obj(
             raise ValueError(f"Config section {sub_key} not found in {config_path}")
         config_dict = config_dict[sub_key]
 
-    print(f"read yaml file {config_path} for config {class_config_obj.__name__}")
+    _logger.debug(f"read yaml file {config_path} for config {class_config_obj.__name__}")
     return class_config_obj(**config_dict)
 
 
+def build_config_obj(
+    class_config_obj: Type[TypeSincproConfigModel],
+    config_path: str,
+    sub_key: str | None = None,
+) -> TypeSincproConfigModel:
+    """Build a config object from a dictionary
+    if sub_key is provided, it will return the sub_key of the config
+
+    The config object is cached until the file or one of the environment variables it
+    references changes, every caller gets its own deep copy of the cached object.
+    """
+    file_stat = os.stat(config_path)
+    mtime_ns, size = file_stat.st_mtime_ns, file_stat.st_size
+    environ = os.environ
+    env_snapshot = tuple(
+        (name, environ.get(name))
+        for name in _file_env_references(config_path, mtime_ns, size)
+    )
+    config = _build_config_obj(
+        class_config_obj, config_path, sub_key, mtime_ns, size, env_snapshot
+    )
+    return config.model_copy(deep=True)
+
+
+def clear_config_cache() -> None:
+    """Forget the parsed yaml files and the config objects built from them, the next
+    build reads the files again even if their modification time and size did not change"""
+    _build_config_obj.cache_clear()
+    _file_env_references.cache_clear()
+    _parse_yaml_file.cache_clear()
+
+
 settings = build_config_obj(DefaultFrameworkConfig, DEFAULT_CONFIG_FILE_PATH)
@@ -1,21 +1,48 @@
-from functools import partial
-from typing import Any, Callable, Dict, Mapping, Optional, Type, cast
+import asyncio
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Type, cast
 
 from sincpro_log.logger import LoggerProxy, create_logger
 
 from . import ioc
 from .bus import FrameworkBus
+from .context.execution_context import EMPTY_CONTEXT, execution_context
 from .context.framework_context import FrameworkContext
 from .context.mixin import ContextMixin
 from .error_handler import ErrorHandler, build_error_handler_chain
-from .exceptions import DependencyAlreadyRegistered, SincproFrameworkNotBuilt
+from .exceptions import (
+    DependencyAlreadyRegistered,
+    SincproFrameworkAlreadyBuilt,
+    SincproFrameworkNotBuilt,
+)
 from .middleware import Middleware, MiddlewarePipeline
-from .sincpro_abstractions import TypeDTO, TypeDTOResponse
+from .sincpro_abstractions import DataTransferObject, TypeDTO, TypeDTOResponse
 
 
 class UseFramework(ContextMixin):
     """Main class to use the framework, this is the main entry point to configure the framework."""
 
+    __slots__ = (
+        "_logger_name",
+        "logger",
+        "log_after_execution",
+        "log_app_services",
+        "log_features",
+        "_context",
+        "_sp_container",
+        "dynamic_dep_registry",
+        "_global_error_handlers",
+        "_feature_error_handlers",
+        "_app_service_error_handlers",
+        "global_error_handler",
+        "feature_error_handler",
+        "app_service_error_handler",
+        "middleware_pipeline",
+        "was_initialized",
+        "bus",
+    )
+
     def __init__(
         self,
         bundled_context_name: str = "sincpro_framework",
@@ -32,26 +59,22 @@ class UseFramework(ContextMixin):
             log_features (bool): Log features, If log_after_execution is False, this will be disabled
         """
         # Logger
-        self._is_logger_configured: bool = False
         self._logger_name: str = bundled_context_name
-        self._logger: LoggerProxy | None = None
+        self.logger: LoggerProxy = create_logger(bundled_context_name)
         self.log_after_execution: bool = log_after_execution
         self.log_app_services: bool = log_app_services
         self.log_features: bool = log_features
 
         # Instance-based context storage
-        self._current_context: Dict[str, Any] = {}
+        self._clean_context()
 
-        # Container
+        # Container, the logger is also set as a plain attribute since the registration
+        # decorators log through `_sp_container.logger_bus` directly, not through the provider
         self._sp_container = ioc.FrameworkContainer(logger_bus=self.logger)  # type: ignore[call-arg]
         self._sp_container.logger_bus = self.logger  # type: ignore[assignment]
 
-        # Decorators
-        self.feature = partial(ioc.inject_feature_to_bus, self._sp_container)
-        self.app_service = partial(ioc.inject_app_service_to_bus, self._sp_container)
-
         # Registry for dynamic dep injection
-        self.dynamic_dep_registry: Dict[str, Any] = dict()
+        self.dynamic_dep_registry: Mapping[str, Any] = dict()
 
         # Error handlers — ordered pipeline (first registered, first executed)
         self._global_error_handlers: list[ErrorHandler] = []
@@ -75,6 +98,46 @@ class UseFramework(ContextMixin):
         :param dto:
         :return: Any response
         """
+        return self._execute(dto, return_type, self._get_context())
+
+    async def acall(
+        self, dto: TypeDTO, return_type: Type[TypeDTOResponse] | None = None
+    ) -> TypeDTOResponse | None:
+        """
+        Execute the framework from a coroutine without blocking the event loop, the
+        execution runs in a worker thread with the framework context read by the awaiting
+        task, so scopes entered later by other tasks do not reach this execution
+        :param dto:
+        :return: Any response
+        """
+        context = self._get_context()
+        return await asyncio.to_thread(self._execute, dto, return_type, context)
+
+    def _execute(
+        self,
+        dto: TypeDTO,
+        return_type: Type[TypeDTOResponse] | None,
+        context: Mapping[str, Any],
+    ) -> TypeDTOResponse | None:
+        """Execute the DTO through the middlewares and the bus with the given context active"""
+        bus = self.bus
+        if bus is None:
+            bus = self._build_on_first_call()
+
+        # Without a context to activate (the common case) there is nothing to set or reset
+        if context is EMPTY_CONTEXT and execution_context.get() is EMPTY_CONTEXT:
+            return self.middleware_pipeline.execute(dto, bus.execute, return_type=return_type)
+
+        # Activate the context of this instance for its features and app services
+        token = execution_context.set(context)
+        try:
+            return self.middleware_pipeline.execute(dto, bus.execute, return_type=return_type)
+        finally:
+            execution_context.reset(token)
+
+    def _build_on_first_call(self) -> FrameworkBus:
+        """Build the bus the first time the framework is called, kept out of __call__ so
+        the executions after the build only check that the bus exists"""
         if not self.was_initialized:
             self.build_root_bus()
 
@@ -83,38 +146,40 @@ class UseFramework(ContextMixin):
                 "Check the decorators are rigistering the features and app services, check the imports of each "
                 "feature and app service"
             )
+        return self.bus
 
-        # Inject current context to services before execution
-        current_context = self._get_context()
-        if current_context:
-            self._inject_context_to_services_and_features(current_context)
-
-        # Execute with middleware pipeline
-        def executor(processed_dto, **exec_kwargs) -> TypeDTOResponse | None:
-            assert (
-                self.bus is not None
-            )  # Help mypy understand this is safe after the check above
-
-            return self.bus.execute(processed_dto)
+    def feature(self, dto: ioc.DTORegistration) -> Callable[[ioc.T], ioc.T]:
+        """Decorator to register a Feature for the given DTO or list of DTOs"""
+        return ioc.inject_feature_to_bus(self._sp_container, dto)
 
-        return self.middleware_pipeline.execute(dto, executor, return_type=return_type)
+    def app_service(self, dto: ioc.DTORegistration) -> Callable[[ioc.T], ioc.T]:
+        """Decorator to register an ApplicationService for the given DTO or list of DTOs"""
+        return ioc.inject_app_service_to_bus(self._sp_container, dto)
 
     def build_root_bus(self):
         """Build the root bus with the dependencies provided by the user"""
         self._add_dependencies_provided_by_user()
         self._add_error_handlers_provided_by_user()
         self.was_initialized = True
+
+        # The dependencies are already injected, later changes would never reach the handlers
+        if type(self.dynamic_dep_registry) is not MappingProxyType:
+            self.dynamic_dep_registry = MappingProxyType(self.dynamic_dep_registry)
         dto_registry = self._sp_container.dto_registry()
 
+        # Build the deferred DTO schemas now, not on the first request
+        for dto in dto_registry.values():
+            if issubclass(dto, DataTransferObject):
+                dto.rebuild()
+
         self.bus = self._sp_container.framework_bus()  # type: ignore[assignment]
 
         # Set the loggers
-        self.bus.log_after_execution = self.log_after_execution
-        self.bus.feature_bus.log_after_execution = (
-            self.log_after_execution and self.log_features
-        )
+        log_after_execution = self.log_after_execution
+        self.bus.log_after_execution = log_after_execution
+        self.bus.feature_bus.log_after_execution = log_after_execution and self.log_features
         self.bus.app_service_bus.log_after_execution = (
-            self.log_after_execution and self.log_app_services
+            log_after_execution and self.log_app_services
         )
 
         # Set the DTO registry Tricky way but it works
@@ -125,9 +190,14 @@ class UseFramework(ContextMixin):
         Add a dependency to the framework where
         The Feature and App Service have as attribute
         """
+        if self.was_initialized:
+            raise SincproFrameworkAlreadyBuilt(
+                f"The dependency {name} can not be added after the framework was built, "
+                f"add the dependencies before executing the first DTO"
+            )
         if name in self.dynamic_dep_registry:
             raise DependencyAlreadyRegistered(f"The dependency {name} is already injected")
-        self.dynamic_dep_registry[name] = dep
+        self.dynamic_dep_registry[name] = dep  # type: ignore[index]
 
     def add_middleware(self, middleware: Middleware):
         """Add middleware function to the execution pipeline"""
@@ -169,10 +239,9 @@ class UseFramework(ContextMixin):
 
             app.add_global_error_handler(logger)
         """
-        if not callable(handler):
-            raise TypeError("The handler must be a callable")
-        self._global_error_handlers.append(handler)
-        self.global_error_handler = build_error_handler_chain(self._global_error_handlers)
+        self.global_error_handler = self._add_error_handler(
+            self._global_error_handlers, handler
+        )
         if self.was_initialized and self.bus is not None:
             self.bus.handle_error = self.global_error_handler
 
@@ -181,10 +250,9 @@ class UseFramework(ContextMixin):
 
         Same semantics as ``add_global_error_handler``.
         """
-        if not callable(handler):
-            raise TypeError("The handler must be a callable")
-        self._feature_error_handlers.append(handler)
-        self.feature_error_handler = build_error_handler_chain(self._feature_error_handlers)
+        self.feature_error_handler = self._add_error_handler(
+            self._feature_error_handlers, handler
+        )
         if self.was_initialized and self.bus is not None:
             self.bus.feature_bus.handle_error = self.feature_error_handler
 
@@ -193,31 +261,34 @@ class UseFramework(ContextMixin):
 
         Same semantics as ``add_global_error_handler``.
         """
-        if not callable(handler):
-            raise TypeError("The handler must be a callable")
-        self._app_service_error_handlers.append(handler)
-        self.app_service_error_handler = build_error_handler_chain(
-            self._app_service_error_handlers
+        self.app_service_error_handler = self._add_error_handler(
+            self._app_service_error_handlers, handler
         )
         if self.was_initialized and self.bus is not None:
             self.bus.app_service_bus.handle_error = self.app_service_error_handler
 
-    def _add_dependencies_provided_by_user(self):
-        if "feature_registry" in self._sp_container.feature_bus.attributes:
-            feature_registry = self._sp_container.feature_bus.attributes[
-                "feature_registry"
-            ].kwargs
-
-            for _, feature in feature_registry.items():
-                feature.add_attributes(**self.dynamic_dep_registry)
-
-        if "app_service_registry" in self._sp_container.app_service_bus.attributes:
-            app_service_registry = self._sp_container.app_service_bus.attributes[
-                "app_service_registry"
-            ].kwargs
+    @staticmethod
+    def _add_error_handler(
+        handlers: list[ErrorHandler], handler: ErrorHandler
+    ) -> Optional[ErrorHandler]:
+        """Append the handler to its pipeline and return the rebuilt chain"""
+        if not callable(handler):
+            raise TypeError("The handler must be a callable")
+        handlers.append(handler)
+        return build_error_handler_chain(handlers)
 
-            for _, app_service in app_service_registry.items():
-                app_service.add_attributes(**self.dynamic_dep_registry)
+    def _add_dependencies_provided_by_user(self):
+        dynamic_deps = self.dynamic_dep_registry
+        if not dynamic_deps:
+            return
+
+        # The container keeps the registries the buses are built with
+        providers = chain(
+            self._sp_container.feature_registry.kwargs.values(),
+            self._sp_container.app_service_registry.kwargs.values(),
+        )
+        for provider in providers:
+            provider.add_attributes(**dynamic_deps)
 
     def _add_error_handlers_provided_by_user(self):
         if self.global_error_handler:
@@ -234,22 +305,3 @@ class UseFramework(ContextMixin):
             self._sp_container.app_service_bus.add_attributes(
                 handle_error=self.app_service_error_handler
             )
-
-    def _execute_with_middleware(
-        self,
-        dto: TypeDTO,
-        executor: Callable,
-        return_type: Type[TypeDTOResponse] | None = None,
-    ) -> TypeDTOResponse | None:
-        """
-        Execute the DTO with the middleware pipeline
-        """
-        return self.middleware_pipeline.execute(dto, executor, return_type=return_type)
-
-    @property
-    def logger(self) -> LoggerProxy:
-        """Get bundle context logger"""
-        if not self._is_logger_configured:
-            self._logger = create_logger(self._logger_name)
-            self._is_logger_configured = True
-        return self._logger  # type: ignore[return-value]
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Mapping, Type, TypeVar, overload
+from typing import Any, Callable, Mapping, Type, TypeVar, overload
 
 from _typeshed import Incomplete
 from sincpro_log.logger import LoggerProxy
@@ -10,6 +10,7 @@ from .context.framework_context import FrameworkContext
 from .context.mixin import ContextMixin
 from .error_handler import ErrorHandler as ErrorHandler
 from .exceptions import DependencyAlreadyRegistered as DependencyAlreadyRegistered
+from .exceptions import SincproFrameworkAlreadyBuilt as SincproFrameworkAlreadyBuilt
 from .exceptions import SincproFrameworkNotBuilt as SincproFrameworkNotBuilt
 from .middleware import Middleware, MiddlewarePipeline
 from .sincpro_abstractions import ApplicationService, DataTransferObject, Feature
@@ -45,16 +46,13 @@ class UseFramework(ContextMixin):
         result = framework(MyDTO(param="value"), MyResponseDTO)
     """
 
+    logger: LoggerProxy
     log_after_execution: bool
     log_app_services: bool
     log_features: bool
 
-    # Decorators with better typing
-    feature: Callable[[DTORegistration], DecoratorFunction]
-    app_service: Callable[[DTORegistration], DecoratorFunction]
-
     middleware_pipeline: MiddlewarePipeline
-    dynamic_dep_registry: Dict[str, Any]
+    dynamic_dep_registry: Mapping[str, Any]
     global_error_handler: ErrorHandler | None
     feature_error_handler: ErrorHandler | None
     app_service_error_handler: ErrorHandler | None
@@ -109,6 +107,61 @@ class UseFramework(ContextMixin):
         """
         ...
 
+    @overload
+    async def acall(
+        self, dto: DataTransferObject, return_type: Type[TypeDTOResponse]
+    ) -> TypeDTOResponse:
+        """
+        Execute a DTO from a coroutine with specified return type.
+
+        The execution runs in a worker thread so the event loop is not blocked.
+
+        Args:
+            dto: The Data Transfer Object to execute
+            return_type: The expected response DTO type
+
+        Returns:
+            The response DTO of the specified type
+        """
+        ...
+
+    @overload
+    async def acall(self, dto: DataTransferObject) -> DataTransferObject | None:
+        """
+        Execute a DTO from a coroutine without specifying return type.
+
+        Args:
+            dto: The Data Transfer Object to execute
+
+        Returns:
+            The response DTO or None if no response
+        """
+        ...
+
+    def feature(self, dto: DTORegistration) -> DecoratorFunction:
+        """
+        Decorator to register a Feature for the given DTO or list of DTOs.
+
+        Args:
+            dto: The DTO (or list of DTOs) handled by the decorated Feature
+
+        Returns:
+            Decorator that registers the class and returns it unchanged
+        """
+        ...
+
+    def app_service(self, dto: DTORegistration) -> DecoratorFunction:
+        """
+        Decorator to register an ApplicationService for the given DTO or list of DTOs.
+
+        Args:
+            dto: The DTO (or list of DTOs) handled by the decorated ApplicationService
+
+        Returns:
+            Decorator that registers the class and returns it unchanged
+        """
+        ...
+
     def build_root_bus(self) -> None:
         """Build the root bus with the dependencies provided by the user."""
         ...
@@ -125,6 +178,7 @@ class UseFramework(ContextMixin):
 
         Raises:
             DependencyAlreadyRegistered: If the dependency name is already registered
+            SincproFrameworkAlreadyBuilt: If the framework was already built
         """
         ...
 
@@ -188,8 +242,3 @@ class UseFramework(ContextMixin):
                 # app_with_context is the same UseFramework instance but with context applied
                 result = app_with_context(some_dto)  # DTO handlers can access the context
         """
-
-    @property
-    def logger(self) -> LoggerProxy:
-        """Get the framework logger instance."""
-        ...
@@ -1,5 +1,7 @@
 """Test instance of FrameworkBus Main facade bus"""
 
+from unittest import mock
+
 import pytest
 
 from sincpro_framework import ApplicationService, DataTransferObject, Feature, bus
@@ -47,6 +49,39 @@ def test_framework_bus_raise_exception_unknown_dto_executed(
         )
 
 
+def test_framework_bus_reuses_the_route_of_an_executed_dto(
+    feature_bus_instance: bus.FeatureBus, app_service_bus_instance: bus.ApplicationServiceBus
+):
+    framework_bus = bus.FrameworkBus(feature_bus_instance, app_service_bus_instance)
+
+    with mock.patch.object(
+        framework_bus, "_resolve_route", return_value=feature_bus_instance
+    ) as resolve_route:
+        for _ in range(2):
+            response = framework_bus.execute(
+                CommandFeatureTest1(to_print="Executed twice"), ResponseFeatureTest1
+            )
+            assert response.to_print == "Executed twice"
+
+    resolve_route.assert_called_once_with(CommandFeatureTest1.__name__)
+
+
+def test_framework_bus_checks_the_route_again_after_a_registration(
+    feature_bus_instance: bus.FeatureBus,
+    app_service_bus_instance: bus.ApplicationServiceBus,
+    app_service_instance_test: ApplicationService,
+):
+    framework_bus = bus.FrameworkBus(feature_bus_instance, app_service_bus_instance)
+    framework_bus.execute(CommandFeatureTest1(to_print="Cached route"), ResponseFeatureTest1)
+
+    app_service_bus_instance.register_app_service(
+        CommandFeatureTest1, app_service_instance_test
+    )
+
+    with pytest.raises(DTOAlreadyRegistered):
+        framework_bus.execute(CommandFeatureTest1(to_print="Conflicting route"))
+
+
 def test_build_framework_bus_with_same_dtos_in_feat_bus_and_app_ser_bus(
     feature_bus_instance: bus.FeatureBus,
     app_service_bus_instance: bus.ApplicationServiceBus,
@@ -5,7 +5,7 @@ import os
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_conf_yaml_path() -> str:
     """"""
     return str(os.path.dirname(__file__) + "/resources/test_conf.yml")
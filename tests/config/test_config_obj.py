@@ -2,34 +2,46 @@
 
 import os
 
+import pytest
+from pydantic import ValidationError
+
 from sincpro_framework.sincpro_conf import SincproConfig, build_config_obj
 
 
-def test_create_config_obj(test_conf_yaml_path: str):
-    """Model the configuration object with (/tests/config/resources/test_conf.yml)"""
+# Configuration models for (/tests/config/resources/test_conf.yml), defined once per module
+class DatabaseFirstConf(SincproConfig):
+    user: str = "user"
+    password: str = "password"
+    port: int = 5432
+
+
+class FirstConf(SincproConfig):
+    log_level: str = "DEBUG"
+    list_of_values: list[str] = ["value1", "value2"]
+    database: DatabaseFirstConf = DatabaseFirstConf()
+
+
+class DigitalOceanSecondConf(SincproConfig):
+    droplet: str = "droplet_default"
+    password: str = "password_default"
+    token: str = "TOKEN EMPTY"
 
-    class DatabaseFirstConf(SincproConfig):
-        user: str = "user"
-        password: str = "password"
-        port: int = 5432
 
-    class FirstConf(SincproConfig):
-        log_level: str = "DEBUG"
-        list_of_values: list[str] = ["value1", "value2"]
-        database: DatabaseFirstConf = DatabaseFirstConf()
+class SecondConf(SincproConfig):
+    digital_ocean: DigitalOceanSecondConf = DigitalOceanSecondConf()
 
-    class DigitalOceanSecondConf(SincproConfig):
-        droplet: str = "droplet_default"
-        password: str = "password_default"
-        token: str = "TOKEN EMPTY"
 
-    class SecondConf(SincproConfig):
-        digital_ocean: DigitalOceanSecondConf = DigitalOceanSecondConf()
+class BundledContextAppConfig(SincproConfig):
+    first_conf: FirstConf = FirstConf()
+    second_conf: SecondConf = SecondConf()
 
-    class BundledContextAppConfig(SincproConfig):
-        first_conf: FirstConf = FirstConf()
-        second_conf: SecondConf = SecondConf()
 
+class LogConf(SincproConfig):
+    log_level: str = "DEBUG"
+
+
+def test_create_config_obj(test_conf_yaml_path: str):
+    """Model the configuration object with (/tests/config/resources/test_conf.yml)"""
     expected_load_env = "EXPECTED LOAD ENV"
     os.environ.setdefault("ANY_TOKEN", expected_load_env)
 
@@ -37,3 +49,11 @@ def test_create_config_obj(test_conf_yaml_path: str):
     assert config_obj.first_conf.log_level == "INFO"
     assert config_obj.second_conf.digital_ocean.token == expected_load_env
     print(config_obj)
+
+
+def test_config_obj_is_immutable(test_conf_yaml_path: str):
+    config_obj = build_config_obj(LogConf, test_conf_yaml_path, sub_key="first_conf")
+
+    with pytest.raises(ValidationError):
+        config_obj.log_level = "INFO"  # type: ignore[misc]
+    assert hash(config_obj) == hash(LogConf(log_level="INFO"))
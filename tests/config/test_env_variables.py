@@ -56,6 +56,24 @@ def test_environment_variables_are_replaced(monkeypatch):
     assert config.int_value == 100
 
 
+def test_config_obj_is_reused_until_a_referenced_env_variable_changes(monkeypatch):
+    """Verify that building the same config twice returns equal but independent objects,
+    and that changing an environment variable referenced by the file builds a new one."""
+    monkeypatch.setenv("TEST_STRING", "first_value")
+    monkeypatch.setenv("TEST_INT", "100")
+
+    first = build_config_obj(_ConfigWithDefaults, CONFIG_WITH_ENV_VARS)
+    again = build_config_obj(_ConfigWithDefaults, CONFIG_WITH_ENV_VARS)
+    assert again == first
+    assert again is not first
+
+    monkeypatch.setenv("TEST_STRING", "second_value")
+    second = build_config_obj(_ConfigWithDefaults, CONFIG_WITH_ENV_VARS)
+
+    assert second.string_value == "second_value"
+    assert first.string_value == "first_value"
+
+
 def test_default_values_used_when_environment_variables_missing():
     """Verify that default values are used when referenced environment variables don't exist.
 
@@ -1,7 +1,52 @@
 """Read the config file and return the resolved config object."""
 
-from sincpro_framework.sincpro_conf import load_yaml_file
+import os
+
+from sincpro_framework.sincpro_conf import (
+    SincproConfig,
+    build_config_obj,
+    clear_config_cache,
+    load_yaml_file,
+)
+
+
+class _ValueConfig(SincproConfig):
+    value: str
 
 
 def test_load_yaml_file(test_conf_yaml_path):
     assert isinstance(load_yaml_file(test_conf_yaml_path), dict)
+
+
+def test_load_yaml_file_returns_independent_copies(test_conf_yaml_path):
+    first = load_yaml_file(test_conf_yaml_path)
+    first["second_conf"]["digital_ocean"]["token"] = "mutated"
+
+    second = load_yaml_file(test_conf_yaml_path)
+    assert second["second_conf"]["digital_ocean"]["token"] == "$ENV:ANY_TOKEN"
+
+    clear_config_cache()
+    assert load_yaml_file(test_conf_yaml_path) == second
+
+
+def test_load_yaml_file_reads_the_file_again_when_it_changes(tmp_path):
+    config_file = tmp_path / "conf.yml"
+    config_file.write_text("value: first\n")
+    assert load_yaml_file(str(config_file)) == {"value": "first"}
+
+    config_file.write_text("value: changed\n")
+    assert load_yaml_file(str(config_file)) == {"value": "changed"}
+
+
+def test_clear_config_cache_reads_a_file_rewritten_with_the_same_stat(tmp_path):
+    config_file = tmp_path / "conf.yml"
+    config_file.write_text("value: first\n")
+    file_stat = os.stat(config_file)
+    assert build_config_obj(_ValueConfig, str(config_file)).value == "first"
+
+    config_file.write_text("value: other\n")
+    os.utime(config_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert build_config_obj(_ValueConfig, str(config_file)).value == "first"
+
+    clear_config_cache()
+    assert build_config_obj(_ValueConfig, str(config_file)).value == "other"
@@ -13,15 +13,15 @@ class ResponseFeatureTest1(DataTransferObject):
 
 class TestFeature(Feature):
     def execute(self, dto: CommandFeatureTest1, **kwargs) -> ResponseFeatureTest1:
-        return ResponseFeatureTest1(**dto.model_dump())
+        return ResponseFeatureTest1.model_construct(to_print=dto.to_print)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def feature_instance_test() -> Feature:
     return TestFeature()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def feature_bus_instance(feature_instance_test) -> bus.FeatureBus:
     feat_bus = bus.FeatureBus()
     feat_bus.register_feature(CommandFeatureTest1, feature_instance_test)
@@ -40,16 +40,16 @@ class TestApplicationService(ApplicationService):
     def execute(self, dto: CommandFeatureTest1, **kwargs) -> ResponseApplicationService1:
         res = self.feature_bus.execute(CommandFeatureTest1(to_print=dto.to_print))
         assert res is not None
-        return ResponseApplicationService1(**res.model_dump())
+        return ResponseApplicationService1.model_construct(to_print=res.to_print)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def app_service_instance_test(feature_bus_instance) -> ApplicationService:
     app_services_instance = TestApplicationService(feature_bus_instance)
     return app_services_instance
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def app_service_bus_instance(
     feature_bus_instance, app_service_instance_test
 ) -> bus.ApplicationServiceBus:
@@ -57,3 +57,24 @@ def app_service_bus_instance(
     app_serv_bus = bus.ApplicationServiceBus()
     app_serv_bus.register_app_service(CommandApplicationService1, app_service_instance_test)
     return app_serv_bus
+
+
+@pytest.fixture(autouse=True)
+def restore_bus_instances(request):
+    """The bus fixtures are shared by the tests of a module, restore the registries and
+    error handlers a test changes"""
+    bus_fixtures = ("feature_bus_instance", "app_service_bus_instance")
+    buses = [
+        request.getfixturevalue(name) for name in bus_fixtures if name in request.fixturenames
+    ]
+    snapshots = [
+        {
+            attr: value.copy() if isinstance(value, dict) else value
+            for attr, value in vars(bus_instance).items()
+        }
+        for bus_instance in buses
+    ]
+    yield
+    for bus_instance, snapshot in zip(buses, snapshots):
+        vars(bus_instance).clear()
+        vars(bus_instance).update(snapshot)
@@ -2,6 +2,8 @@
 Tests for the Context Manager functionality in Sincpro Framework
 """
 
+import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, cast
 
@@ -112,6 +114,21 @@ class TestFrameworkContext:
         with pytest.raises(RuntimeError, match="Context manager is already entered"):
             context_manager.__enter__()
 
+    def test_parent_context_is_restored_without_copying(self):
+        """Test the exact parent context object is restored after exit"""
+        framework = UseFramework("test-service")
+
+        with framework.context({"correlation_id": "parent"}):
+            parent_context = framework._get_context()
+
+            with framework.context({"user": "nested"}):
+                assert framework._get_context() == {
+                    "correlation_id": "parent",
+                    "user": "nested",
+                }
+
+            assert framework._get_context() is parent_context
+
 
 class TestContextMixin:
     """Test the ContextMixin functionality"""
@@ -133,7 +150,7 @@ class TestContextMixin:
         assert framework._get_context() == {}
 
     def test_context_injection_to_services(self):
-        """Test context injection to features and services"""
+        """Test context is exposed to features only while a DTO is executed"""
         framework = UseFramework("test-service")
 
         # Register a simple feature first
@@ -144,17 +161,20 @@ class TestContextMixin:
         # Manually call build to initialize the bus
         framework.build_root_bus()
 
-        # Set context and inject to services
         test_context = {"correlation_id": "inject-test", "user": "testuser"}
-        framework._inject_context_to_services_and_features(test_context)
+        framework._set_context(test_context)
 
-        # Verify context was injected to features
+        result = framework(ContextTestDTO(message="test"), ContextTestResponseDTO)
+        assert result is not None
+        assert result.context_data == test_context
+
+        # Outside an execution the features see an empty read-only context
         assert framework.bus is not None
         feature_registry = framework.bus.feature_bus.feature_registry
-
         for feature in feature_registry.values():
-            assert hasattr(feature, "context")
-            assert feature.context == test_context
+            assert feature.context == {}
+            with pytest.raises(TypeError):
+                feature.context["user"] = "other"  # type: ignore[index]
 
 
 class TestUseFrameworkContext:
@@ -290,6 +310,115 @@ class TestUseFrameworkContext:
                 # Verify they don't interfere with each other
                 assert result1.context_data != result2.context_data
 
+    def test_framework_without_context_called_from_another_framework(self):
+        """Test a framework without context does not see the context of its caller"""
+        inner = UseFramework("inner-service")
+        outer = UseFramework("outer-service")
+
+        @inner.feature(ContextTestDTO)
+        class InnerFeature(ContextAwareFeature):
+            pass
+
+        @outer.feature(ContextAppServiceDTO)
+        class OuterFeature(Feature):
+            def execute(self, dto):
+                inner_result = cast(
+                    ContextTestResponseDTO, inner(ContextTestDTO(message="inner"))
+                )
+                return ContextAppServiceResponseDTO(
+                    result=self.context["service"],
+                    context_data=inner_result.context_data,
+                )
+
+        with outer.context({"service": "outer-service"}) as app:
+            result = cast(
+                ContextAppServiceResponseDTO, app(ContextAppServiceDTO(operation="call"))
+            )
+
+            assert result.result == "outer-service"
+            assert result.context_data == {}
+
+    def test_context_is_propagated_to_async_executions(self):
+        """Test acall executes the DTO with the context of the framework"""
+        framework = UseFramework("test-service")
+
+        @framework.feature(ContextTestDTO)
+        class AsyncContextFeature(ContextAwareFeature):
+            pass
+
+        async def run_in_context():
+            with framework.context({"correlation_id": "async-123"}) as app:
+                return await app.acall(
+                    ContextTestDTO(message="async"), ContextTestResponseDTO
+                )
+
+        result = asyncio.run(run_in_context())
+
+        assert result is not None
+        assert result.result == "processed: async"
+        assert result.context_data == {"correlation_id": "async-123"}
+
+    def test_async_execution_keeps_the_context_read_when_awaited(self):
+        """Test acall uses the context of the awaiting task, not one entered later"""
+        framework = UseFramework("test-service")
+        b_executed = threading.Event()
+
+        @framework.feature(ContextTestDTO)
+        class BlockingContextFeature(ContextAwareFeature):
+            def execute(self, dto):
+                if dto.message == "A":
+                    assert b_executed.wait(timeout=5)
+                else:
+                    b_executed.set()
+                return super().execute(dto)
+
+        async def run_overlapping():
+            a_called, b_exited = asyncio.Event(), asyncio.Event()
+
+            async def run_a():
+                with framework.context({"id": "A"}) as app:
+                    a_called.set()
+                    result = await app.acall(
+                        ContextTestDTO(message="A"), ContextTestResponseDTO
+                    )
+                    await b_exited.wait()
+                    return result
+
+            async def run_b():
+                await a_called.wait()
+                try:
+                    with framework.context({"id": "B"}) as app:
+                        return await app.acall(
+                            ContextTestDTO(message="B"), ContextTestResponseDTO
+                        )
+                finally:
+                    b_exited.set()
+
+            return await asyncio.gather(run_a(), run_b())
+
+        result_a, result_b = asyncio.run(run_overlapping())
+
+        assert result_a is not None and result_b is not None
+        assert result_a.context_data == {"id": "A"}
+        assert result_b.context_data == {"id": "B"}
+        assert framework._get_context() == {}
+
+    def test_context_is_visible_to_worker_threads(self):
+        """Test the context of a scope reaches executions started from worker threads"""
+        framework = UseFramework("test-service")
+
+        @framework.feature(ContextTestDTO)
+        class ThreadContextFeature(ContextAwareFeature):
+            pass
+
+        dtos = [ContextTestDTO(message=f"thread {i}") for i in range(4)]
+        with framework.context({"tenant": "acme"}) as app:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(app, dtos))
+
+            for result in results:
+                assert cast(ContextTestResponseDTO, result).context_data == {"tenant": "acme"}
+
     def test_context_cleanup_after_exit(self):
         """Test that context is properly cleaned up after exiting context manager"""
         framework = UseFramework("test-service")
@@ -461,6 +590,11 @@ class TestUseFrameworkContext:
             )
             assert result.context_data == {}
 
+        with framework.context({"correlation_id": "parent"}):
+            parent_context = framework._get_context()
+            with framework.context({}):
+                assert framework._get_context() is parent_context
+
     def test_context_override_behavior(self):
         """Test context override behavior in nested contexts"""
         framework = UseFramework("override-test")
@@ -156,6 +156,35 @@ class TestMiddlewarePipeline:
         with pytest.raises(ValueError, match="Amount must be positive"):
             pipeline.execute(invalid_dto, test_executor)
 
+    def test_middleware_added_after_first_execution(self):
+        """Test that a middleware added after executing is part of the next executions"""
+        pipeline = MiddlewarePipeline()
+
+        def test_executor(processed_dto, **kwargs):
+            return processed_dto
+
+        first = pipeline.execute(OriginalDTO(name="John", age=30), test_executor)
+        assert not hasattr(first, "processed")
+
+        pipeline.add_middleware(add_processed_flag)
+        second = pipeline.execute(OriginalDTO(name="John", age=30), test_executor)
+        assert second.processed is True
+
+    def test_middlewares_list_edited_directly_is_used(self):
+        """Test that editing the middlewares list directly applies to the next executions"""
+        pipeline = MiddlewarePipeline()
+        pipeline.add_middleware(add_processed_flag)
+
+        def test_executor(processed_dto, **kwargs):
+            return processed_dto
+
+        first = pipeline.execute(OriginalDTO(name="John", age=30), test_executor)
+        assert first.processed is True
+
+        pipeline.middlewares.clear()
+        second = pipeline.execute(OriginalDTO(name="John", age=30), test_executor)
+        assert not hasattr(second, "processed")
+
 
 class TestMiddlewareIntegration:
     """Test middleware integration with UseFramework using the monkey patching approach"""
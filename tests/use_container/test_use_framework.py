@@ -1,7 +1,10 @@
+import pytest
+
 from sincpro_framework import ApplicationService as _ApplicationService
 from sincpro_framework import DataTransferObject
 from sincpro_framework import Feature as _Feature
 from sincpro_framework import UseFramework as _UseFramework
+from sincpro_framework.exceptions import SincproFrameworkAlreadyBuilt
 
 
 # ----------------------------------------------------------------------
@@ -100,3 +103,39 @@ def test_use_framework():
     cmd = CmdExecuteAppService(app_param_1="param1", app_param_2=2)
     res = fake_bundle_context(cmd, ResAppService)
     assert res.app_result.startswith("App service result from")
+
+
+def test_registered_dtos_schema_is_built_with_the_bus():
+    framework = _UseFramework("fake-rebuild-context", log_after_execution=False)
+
+    class RebuildCmdDTO(DataTransferObject):
+        value: str
+
+    class RebuildResponseDTO(DataTransferObject):
+        value: str
+
+    class NotRegisteredDTO(DataTransferObject):
+        value: str
+
+    @framework.feature(RebuildCmdDTO)
+    class RebuildFeature(_Feature):
+        def execute(self, dto: RebuildCmdDTO) -> RebuildResponseDTO:
+            return RebuildResponseDTO(value=dto.value)
+
+    assert not RebuildCmdDTO.__pydantic_complete__
+
+    framework.build_root_bus()
+
+    assert RebuildCmdDTO.__pydantic_complete__
+    assert not NotRegisteredDTO.__pydantic_complete__
+
+
+def test_add_dependency_after_build_is_rejected():
+    fake_bundle_context.build_root_bus()
+
+    with pytest.raises(SincproFrameworkAlreadyBuilt):
+        fake_bundle_context.add_dependency("late_dependency", FakeClient())
+
+    assert "late_dependency" not in fake_bundle_context.dynamic_dep_registry
+    with pytest.raises(TypeError):
+        fake_bundle_context.dynamic_dep_registry["late_dependency"] = FakeClient()  # type: ignore[index]